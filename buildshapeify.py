@@ -1,19 +1,61 @@
 #! python3
-import argparse
 import copy
 import datetime
+import functools
+import itertools
 import logging
+import logging.handlers
+import os
 import pathlib
+import re
 import shutil
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, Iterable, Sequence, Tuple, Union
-from xml.etree import ElementTree
+from typing import Dict, Iterable, Sequence, Set, Tuple, Union
+
+from lxml import etree as ElementTree
 
 TEMPLATE_SCO_IDENTIFIER = '[sco'
 TEMPLATE_MAT_IDENTIFIER = '[mat'
 TEMPLATE_DIR = './templates'
+MAX_WORKERS = min(32, (os.cpu_count() or 4) * 2)
+WRITE_BUFFER_SIZE = 1 << 16
+
+SCO_PLACEHOLDERS = (
+    '{preview}',
+    '{original_usercolors}',
+    '{scale_settings}',
+    '{material_name}',
+)
+SCO_PLACEHOLDER_PATTERN = re.compile(
+    '|'.join(re.escape(placeholder) for placeholder in SCO_PLACEHOLDERS)
+)
+
+TEXUNIT_START_PATTERN = re.compile(rb'<texunit[\s/>]')
+TEXUNIT_END_PATTERN = re.compile(rb'</texunit\s*>')
+
+XPATH_TEMPLATE_TEXUNIT = ElementTree.XPath(
+    './material/renderpass/texunit[1]')
+XPATH_TEXUNITS = ElementTree.XPath('./material/renderpass/texunit')
+XPATH_TEXTURE_MAPS = ElementTree.XPath('./material/renderpass/texunit/map')
+XPATH_PREVIEW = ElementTree.XPath('./sceneobject/preview[1]')
+XPATH_USERCOLORS = ElementTree.XPath('./sceneobject/usercolor')
+
+ARGUMENT_DEFAULTS = {
+    'scale': None,
+    'nl2mat_out': './Scaleable Build Shapes/resources/materials/',
+    'nl2sco_out': './Scaleable Build Shapes/',
+    'preview_out': './Scaleable Build Shapes/resources/previews/',
+}
+ARGUMENT_TYPES = {
+    'scale': float,
+    'nl2mat_out': str,
+    'nl2sco_out': str,
+    'preview_out': str,
+}
 
 TUTORIAL_FILE = 'How to Use Buildshapeify.txt'
 TUTORIAL_TEXT = """Buildshapeify by bestdani
@@ -39,6 +81,10 @@ if getattr(sys, 'frozen', False):
 elif __file__:
     exec_dir = pathlib.Path(__file__).parent.absolute()
 
+copied_files_lock = threading.Lock()
+created_dirs: Set[pathlib.Path] = set()
+created_dirs_lock = threading.Lock()
+
 
 @dataclass
 class RunGroup:
@@ -47,7 +93,16 @@ class RunGroup:
 
     @classmethod
     def from_path_content(cls, path: pathlib.Path) -> 'RunGroup':
-        nl2sco_files = tuple(path.glob('*.nl2sco'))
+        nl2sco_files = []
+        nl2mat_files = []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                name = os.path.normcase(entry.name)
+                if name.endswith('.nl2sco') and entry.is_file():
+                    nl2sco_files.append(pathlib.Path(entry.path))
+                elif name.endswith('.nl2mat') and entry.is_file():
+                    nl2mat_files.append(pathlib.Path(entry.path))
+
         nl2sco_file = nl2sco_files[0] if len(nl2sco_files) > 0 else None
         if len(nl2sco_files) > 1:
             logging.warning(
@@ -57,8 +112,7 @@ class RunGroup:
 
                 f"> '{nl2sco_file.name}' has been picked."
             )
-        nl2mat_files = tuple(path.glob('*.nl2mat'))
-        return cls(nl2sco_file, nl2mat_files)
+        return cls(nl2sco_file, tuple(nl2mat_files))
 
     @classmethod
     def groups_from_paths(
@@ -93,43 +147,120 @@ class RunConfiguration:
 
     @classmethod
     def from_args(cls, args=None):
-        parser = argparse.ArgumentParser()
-        parser.add_argument('files', nargs='*')
-        parser.add_argument('--scale', nargs=1, type=float)
-        parser.add_argument(
-            '--nl2mat_out', nargs=1, type=str,
-            default='./Scaleable Build Shapes/'
-                    'resources/materials/')
-        parser.add_argument(
-            '--nl2sco_out', nargs=1, type=str,
-            default='./Scaleable Build Shapes/')
-        parser.add_argument(
-            '--preview_out', nargs=1, type=str,
-            default='./Scaleable Build Shapes/'
-                    'resources/previews/')
-        if args:
-            arguments = parser.parse_args(args)
-        else:
-            arguments = parser.parse_args(args)
+        if args is None:
+            args = sys.argv[1:]
+        arguments = parse_simple_arguments(args)
+        if arguments is None:
+            arguments = vars(create_argument_parser().parse_args(args))
+        return cls(
+            RunGroup.groups_from_paths(arguments['files']),
+            arguments['nl2mat_out'], arguments['nl2sco_out'],
+            arguments['preview_out'], arguments['scale'],
+        )
+
+
+@dataclass
+class MatTemplate:
+    file: pathlib.Path
+    dst_name: str
+    tc_entries: Sequence[ElementTree.Element]
+    tc_content: bytes
+
+    @classmethod
+    def from_file(cls, template_file: pathlib.Path) -> 'MatTemplate':
+        tc_entries = get_tc_entries(ElementTree.parse(str(template_file)))
+        return cls(
+            template_file, template_file.stem + '.nl2mat',
+            tc_entries, get_tc_content(tc_entries)
+        )
+
+
+@dataclass
+class ScoTemplate:
+    file: pathlib.Path
+    dst_name: str
+    content: str
+
+    @classmethod
+    def from_file(cls, template_file: pathlib.Path) -> 'ScoTemplate':
         return cls(
-            RunGroup.groups_from_paths(arguments.files),
-            arguments.nl2mat_out, arguments.nl2sco_out,
-            arguments.preview_out, arguments.scale,
+            template_file, template_file.stem + '.nl2sco',
+            read_content_of(template_file)
         )
 
 
+def parse_simple_arguments(args: Sequence[str]) -> Union[None, Dict]:
+    # handles the usual drag and drop arguments without importing argparse,
+    # None is returned for everything else (like -h) to let argparse handle it
+    arguments = {**ARGUMENT_DEFAULTS, 'files': []}
+    remaining_args = iter(args)
+    for arg in remaining_args:
+        if not arg.startswith('-') or arg == '-':
+            arguments['files'].append(arg)
+            continue
+
+        option, has_value, value = arg.partition('=')
+        name = option[2:] if option.startswith('--') else None
+        if name not in ARGUMENT_TYPES:
+            return None
+        if not has_value:
+            value = next(remaining_args, None)
+            # argparse decides whether something like -1 is a value or an
+            # option
+            if value is None or value.startswith('-'):
+                return None
+        try:
+            arguments[name] = ARGUMENT_TYPES[name](value)
+        except ValueError:
+            return None
+    return arguments
+
+
+def create_argument_parser():
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('files', nargs='*')
+    for name, argument_type in ARGUMENT_TYPES.items():
+        parser.add_argument(
+            f'--{name}', type=argument_type, default=ARGUMENT_DEFAULTS[name])
+    return parser
+
+
 def read_content_of(template_file):
     with open(template_file) as handle:
         content = handle.read()
     return content
 
 
+def is_up_to_date(src: pathlib.Path, dst: pathlib.Path) -> bool:
+    try:
+        dst_stat = dst.stat()
+    except FileNotFoundError:
+        return False
+    src_stat = src.stat()
+    return (
+            dst_stat.st_size == src_stat.st_size and
+            dst_stat.st_mtime >= src_stat.st_mtime
+    )
+
+
+def ensure_directory(path: pathlib.Path):
+    with created_dirs_lock:
+        if path not in created_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            created_dirs.add(path)
+
+
 def copy_files(src_dst_list: Iterable[Tuple[pathlib.Path, pathlib.Path]]):
     for src, dst in src_dst_list:
         try:
+            if is_up_to_date(src, dst):
+                logging.info(f"skipped copying {src}, {dst} is up to date")
+                continue
             logging.info(f"copying {src} to {dst}")
-            dst.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy(str(src), str(dst))
+            ensure_directory(dst.parent)
+            shutil.copyfile(str(src), str(dst))
         except OSError as exception:
             logging.warning(
                 f"skipped {src}, since the file cannot be accessed "
@@ -144,15 +275,10 @@ def copy_files(src_dst_list: Iterable[Tuple[pathlib.Path, pathlib.Path]]):
 
 
 def transform_to_dst_file(
-        template_file: pathlib.Path, replace_string: str, replaced_name: str,
-        suffix: str, dst_path: pathlib.Path
+        dst_name_template: str, replace_string: str, replaced_name: str,
+        dst_path: pathlib.Path
 ) -> pathlib.Path:
-    new_file_path = template_file.with_name(
-        template_file.name.replace(replace_string, replaced_name)
-    )
-    new_file_path = new_file_path.with_suffix(suffix)
-    new_file_path = dst_path / new_file_path.parts[-1]
-    return new_file_path
+    return dst_path / dst_name_template.replace(replace_string, replaced_name)
 
 
 def write_content_to(content: str, file: Union[str, pathlib.Path]):
@@ -160,93 +286,153 @@ def write_content_to(content: str, file: Union[str, pathlib.Path]):
         handle.write(content)
 
 
+def get_tc_entries(
+        template_tree: ElementTree.ElementTree
+) -> Sequence[ElementTree.Element]:
+    template_texunit = XPATH_TEMPLATE_TEXUNIT(template_tree)[0]
+    return list(template_texunit)
+
+
+def get_tc_content(tc_entries: Sequence[ElementTree.Element]) -> bytes:
+    return b''.join(ElementTree.tostring(entry) for entry in tc_entries)
+
+
+def has_processing_instructions(nl2mat_tree: ElementTree.ElementTree) -> bool:
+    root = nl2mat_tree.getroot()
+    instructions = itertools.chain(
+        root.itersiblings(ElementTree.ProcessingInstruction, preceding=True),
+        root.itersiblings(ElementTree.ProcessingInstruction),
+        root.iter(ElementTree.ProcessingInstruction)
+    )
+    return any(True for _ in instructions)
+
+
+def can_splice_tc_info(
+        nl2mat_tree: ElementTree.ElementTree, nl2mat_content: bytes
+) -> bool:
+    # comments, CDATA sections, a DOCTYPE and processing instructions can
+    # contain texunit tags that are not elements
+    if b'<!' in nl2mat_content or has_processing_instructions(nl2mat_tree):
+        return False
+    # without those every tag in the bytes is a real element, so matching
+    # counts pair each end tag with a renderpass texunit and rule out
+    # self-closing texunits
+    texunit_count = len(XPATH_TEXUNITS(nl2mat_tree))
+    all_texunit_count = sum(1 for _ in nl2mat_tree.iter('texunit'))
+    start_tag_count = len(TEXUNIT_START_PATTERN.findall(nl2mat_content))
+    end_tag_count = len(TEXUNIT_END_PATTERN.findall(nl2mat_content))
+    return (
+            texunit_count == all_texunit_count ==
+            start_tag_count == end_tag_count
+    )
+
+
+def with_spliced_tc_info(tc_content: bytes, nl2mat_content: bytes) -> bytes:
+    return TEXUNIT_END_PATTERN.sub(
+        lambda match: tc_content + match.group(0), nl2mat_content
+    )
+
+
 def with_tc_info_from(
-        template_file: pathlib.Path, nl2mat_tree: ElementTree.ElementTree
+        tc_entries: Sequence[ElementTree.Element],
+        nl2mat_content: bytes
 ) -> ElementTree.ElementTree:
-    new_nl2mat_tree = copy.deepcopy(nl2mat_tree)
-    template_tree = ElementTree.parse(template_file)
-    template_texunit = template_tree.find('./material/renderpass/texunit')
+    new_nl2mat_tree = ElementTree.ElementTree(
+        ElementTree.fromstring(nl2mat_content))
 
-    nl2mat_texunits = new_nl2mat_tree.findall('./material/renderpass/texunit')
-    for texunit in nl2mat_texunits:
+    for texunit in XPATH_TEXUNITS(new_nl2mat_tree):
         texunit: ElementTree.Element
-        for tc_entry in template_texunit:
-            texunit.append(tc_entry)
+        # lxml moves appended elements, so every texunit needs a copy
+        texunit.extend(copy.deepcopy(tc_entries))
     return new_nl2mat_tree
 
 
 def with_applied_placeholders(
-        template_file: pathlib.Path,
+        template_content: str,
         replacements: Dict[str, str]
 ) -> str:
-    content = read_content_of(template_file)
-    for placeholder, replacement in replacements.items():
-        content = content.replace(placeholder, replacement)
-    return content
+    return SCO_PLACEHOLDER_PATTERN.sub(
+        lambda match: replacements.get(match.group(0), match.group(0)),
+        template_content
+    )
 
 
 def create_nl2scos(
-        sco_templates: Iterable[pathlib.Path],
+        sco_templates: Iterable[ScoTemplate],
         placeholders_replacements: Dict,
-        material_name: str,
+        capitalized_name: str,
         dst_path: pathlib.Path
 ):
     for sco_template in sco_templates:
         new_nl2sco_content = with_applied_placeholders(
-            sco_template, placeholders_replacements
+            sco_template.content, placeholders_replacements
         )
         dst_nl2sco = transform_to_dst_file(
-            sco_template,
-            '[sco]', material_name.capitalize(), '.nl2sco',
-            dst_path
+            sco_template.dst_name, '[sco]', capitalized_name, dst_path
         )
         logging.info(f"creating {dst_nl2sco}")
         write_content_to(new_nl2sco_content, dst_nl2sco)
 
 
 def get_referenced_textures(nl2mat_tree) -> Iterable[str]:
-    map_nodes = nl2mat_tree.findall('./material/renderpass/texunit/map')
+    map_nodes = XPATH_TEXTURE_MAPS(nl2mat_tree)
     return (node.text for node in map_nodes)
 
 
 def handle_materials(
         nl2mat_file: pathlib.Path,
-        tc_templates: Iterable[pathlib.Path],
-        material_name: str,
-        dst_path: pathlib.Path
+        tc_templates: Iterable[MatTemplate],
+        bracketed_name: str,
+        dst_path: pathlib.Path,
+        copied_files: Dict[pathlib.Path, pathlib.Path]
 ):
     origin_path = nl2mat_file.parent
-    nl2mat_tree: ElementTree.ElementTree = ElementTree.parse(nl2mat_file)
-    texture_copies = (
-        (origin_path / texture, dst_path / texture)
-        for texture in get_referenced_textures(nl2mat_tree)
-    )
+    nl2mat_content = nl2mat_file.read_bytes()
+    nl2mat_tree = ElementTree.ElementTree(
+        ElementTree.fromstring(nl2mat_content))
+    texture_copies = []
+    for texture in get_referenced_textures(nl2mat_tree):
+        src, dst = origin_path / texture, dst_path / texture
+        with copied_files_lock:
+            copied_src = copied_files.setdefault(dst, src)
+        if copied_src is src:
+            texture_copies.append((src, dst))
+        elif copied_src != src:
+            logging.warning(
+                f"skipped {src}, since {dst} has already been copied from "
+                f"{copied_src}"
+            )
     copy_files(texture_copies)
-    for template_file in tc_templates:
+    ensure_directory(dst_path)
+    # plain texunit end tags allow inserting the tc entries as text, otherwise
+    # the nl2mat has to be rebuilt as a tree
+    splice_tc_info = can_splice_tc_info(nl2mat_tree, nl2mat_content)
+    for tc_template in tc_templates:
         dst_nl2mat = transform_to_dst_file(
-            template_file,
-            '[mat]', f'[{material_name}]', '.nl2mat',
-            dst_path
-        )
-        new_nl2mat_content = with_tc_info_from(
-            template_file, nl2mat_tree
+            tc_template.dst_name, '[mat]', bracketed_name, dst_path
         )
         logging.info(f"creating {dst_nl2mat}")
-        dst_nl2mat.parent.mkdir(parents=True, exist_ok=True)
-        new_nl2mat_content.write(dst_nl2mat)
+        with open(dst_nl2mat, 'wb', buffering=WRITE_BUFFER_SIZE) as handle:
+            if splice_tc_info:
+                handle.write(with_spliced_tc_info(
+                    tc_template.tc_content, nl2mat_content))
+            else:
+                new_nl2mat_content = with_tc_info_from(
+                    tc_template.tc_entries, nl2mat_content
+                )
+                new_nl2mat_content.write(
+                    handle, method='xml', encoding='utf-8',
+                    xml_declaration=True, pretty_print=False
+                )
 
 
 def get_sco_replacements(nl2sco_file, preview_dst, sco_dst):
-    replacements = {
-        '{preview}': '',
-        '{original_usercolors}': '',
-        '{scale_settings}': '',
-        '{material_name}': ''
-    }
+    replacements = dict.fromkeys(SCO_PLACEHOLDERS, '')
     if nl2sco_file:
         sco_tree = ElementTree.parse(nl2sco_file)
-        preview = sco_tree.find('./sceneobject/preview')
-        if preview is not None:
+        previews = XPATH_PREVIEW(sco_tree)
+        if previews:
+            preview = previews[0]
             preview_src_file = nl2sco_file.parent / preview.text
             preview_dst_file = preview_dst / preview.text
             copy_files([(preview_src_file, preview_dst_file)])
@@ -254,8 +440,8 @@ def get_sco_replacements(nl2sco_file, preview_dst, sco_dst):
             replacements['{preview}'] = f"<preview>{preview_text}</preview>"
 
         usercolors = tuple(
-            ElementTree.tostring(color, encoding='unicode')
-            for color in sco_tree.findall('./sceneobject/usercolor')
+            ElementTree.tostring(color, encoding='unicode', with_tail=False)
+            for color in XPATH_USERCOLORS(sco_tree)
         )
         if usercolors:
             replacements['{original_usercolors}'] = '\n'.join(usercolors)
@@ -263,6 +449,47 @@ def get_sco_replacements(nl2sco_file, preview_dst, sco_dst):
     return replacements
 
 
+def process_material_file(
+        mat_file, mat_tc_templates, mat_dst,
+        sco_templates, sco_dst, sco_replacements, copied_files
+):
+    material_name = mat_file.stem
+    capitalized_name = material_name.capitalize()
+    bracketed_name = f'[{material_name}]'
+    handle_materials(
+        mat_file, mat_tc_templates, bracketed_name, mat_dst, copied_files
+    )
+
+    material_sco_replacements = {
+        **sco_replacements, '{material_name}': material_name
+    }
+    create_nl2scos(
+        sco_templates, material_sco_replacements, capitalized_name, sco_dst
+    )
+
+
+def get_output_name_batches(
+        nl2mat_files: Sequence[pathlib.Path]
+) -> Sequence[Sequence[pathlib.Path]]:
+    # materials whose output files would overwrite each other end up in the
+    # same batch to be processed one after another
+    batches = {}
+    for mat_file in nl2mat_files:
+        output_name = os.path.normcase(mat_file.stem.capitalize())
+        batches.setdefault(output_name, []).append(mat_file)
+
+    for batch in batches.values():
+        if len(batch) > 1:
+            batch_printouts = "\n".join(f"\t{entry}" for entry in batch)
+            logging.warning(
+                "the following nl2mat files create output files with the "
+                "same names, they are processed one after another and the "
+                "last one overwrites the others:\n"
+                f"{batch_printouts}"
+            )
+    return tuple(batches.values())
+
+
 def process_group_files(
         nl2mat_files, mat_tc_templates, mat_dst,
         nl2sco_file, sco_templates, sco_dst, preview_dst,
@@ -270,14 +497,18 @@ def process_group_files(
     sco_replacements = get_sco_replacements(
         nl2sco_file, preview_dst, sco_dst)
 
-    for mat_file in nl2mat_files:
-        material_name = mat_file.stem
-        handle_materials(mat_file, mat_tc_templates, material_name, mat_dst)
+    def process_batch(mat_files):
+        for mat_file in mat_files:
+            process_material_file(
+                mat_file, mat_tc_templates, mat_dst,
+                sco_templates, sco_dst, sco_replacements, copied_files
+            )
 
-        sco_replacements['{material_name}'] = material_name
-        create_nl2scos(
-            sco_templates, sco_replacements, material_name, sco_dst
-        )
+    copied_files = {}
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        tuple(executor.map(
+            process_batch, get_output_name_batches(nl2mat_files)
+        ))
 
 
 def run_for_config(run_config, mat_tc_templates, sco_templates):
@@ -291,22 +522,51 @@ def run_for_config(run_config, mat_tc_templates, sco_templates):
         )
 
 
-def get_template_files(path, identifier) -> Iterable[pathlib.Path]:
-    return pathlib.Path(path).glob(f'{identifier}*.xml')
+@functools.lru_cache(maxsize=None)
+def get_template_files(path, identifier) -> Sequence[pathlib.Path]:
+    identifier = os.path.normcase(identifier)
+    template_files = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            name = os.path.normcase(entry.name)
+            if (name.startswith(identifier) and name.endswith('.xml') and
+                    entry.is_file()):
+                template_files.append(pathlib.Path(entry.path))
+    return tuple(template_files)
 
 
-def setup_logging():
+def setup_logging() -> logging.handlers.MemoryHandler:
     logging.basicConfig(level=logging.INFO)
     logger = logging.getLogger('')
 
+    # records are held back until it is known whether a log file is needed
+    log_buffer = logging.handlers.MemoryHandler(
+        capacity=100, flushLevel=logging.CRITICAL + 1)
+    log_buffer.setLevel(logging.INFO)
+
+    logger.addHandler(log_buffer)
+    return log_buffer
+
+
+def start_log_file(log_buffer: logging.handlers.MemoryHandler):
+    logger = logging.getLogger('')
+
     log_file_date = datetime.datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
     log_file = exec_dir / f"buildshapeify_{log_file_date}.log"
     file_handler = logging.FileHandler(log_file)
     file_handler.setLevel(logging.INFO)
 
+    log_buffer.setTarget(file_handler)
+    logger.removeHandler(log_buffer)
+    log_buffer.close()
     logger.addHandler(file_handler)
 
 
+def discard_log_buffer(log_buffer: logging.handlers.MemoryHandler):
+    logging.getLogger('').removeHandler(log_buffer)
+    log_buffer.close()
+
+
 def create_tutorial_file(tutorial_file: pathlib.Path):
     file = str(tutorial_file)
     with open(file, 'w') as handle:
@@ -315,7 +575,7 @@ def create_tutorial_file(tutorial_file: pathlib.Path):
 
 
 def main():
-    setup_logging()
+    log_buffer = setup_logging()
     run_config = RunConfiguration.from_args()
 
     show_tutorial = (
@@ -324,23 +584,31 @@ def main():
     )
 
     if show_tutorial:
+        discard_log_buffer(log_buffer)
         logging.info("showing tutorial since no files have been dropped")
         create_tutorial_file(exec_dir / TUTORIAL_FILE)
     else:
-        mat_tc_templates = tuple(get_template_files(
-            exec_dir / TEMPLATE_DIR, TEMPLATE_MAT_IDENTIFIER))
+        start_log_file(log_buffer)
+        mat_tc_templates = tuple(
+            MatTemplate.from_file(template_file)
+            for template_file in get_template_files(
+                exec_dir / TEMPLATE_DIR, TEMPLATE_MAT_IDENTIFIER)
+        )
         mat_template_printouts = "\n".join(
-            f"\t{entry}" for entry in mat_tc_templates
+            f"\t{template.file}" for template in mat_tc_templates
         )
         logging.info(
             "found the following material templates:\n"
             f"{mat_template_printouts}"
         )
 
-        sco_templates = tuple(get_template_files(
-            exec_dir / TEMPLATE_DIR, TEMPLATE_SCO_IDENTIFIER))
+        sco_templates = tuple(
+            ScoTemplate.from_file(template_file)
+            for template_file in get_template_files(
+                exec_dir / TEMPLATE_DIR, TEMPLATE_SCO_IDENTIFIER)
+        )
         sco_template_printouts = "\n".join(
-            f"\t{entry}" for entry in sco_templates
+            f"\t{template.file}" for template in sco_templates
         )
         logging.info(
             "found the following sco templates:\n"